@@ -1,8 +1,235 @@
-from typing import Literal
+from collections import OrderedDict
+from typing import Callable, Hashable, Literal
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+    from numba.experimental import jitclass
+except ImportError:
+    prange = range
+
+    def jitclass(cls):
+        """
+        Fallback used when numba is not installed: the decorated class
+        is returned unchanged.
+        """
+        return cls
+
+    def njit(*args, **kwargs):
+        """
+        Fallback used when numba is not installed: the decorated
+        function is returned unchanged and runs as plain python.
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+# numba's fastmath flags without "nnan" and "ninf", so NaN and inf
+# values (missing prices, a zero downward RMA) keep their IEEE meaning.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _rma_kernel(
+    tail: np.ndarray,
+    seed: float,
+    alpha: float,
+    out: np.ndarray
+) -> None:
+    """
+    Fill `out` with the RMA recurrence starting from `seed`.
+
+    Parameters:
+    -----------
+    tail : np.ndarray
+        The source values after the seed period.
+    seed : float
+        The initial RMA value (the SMA of the first `length` values).
+    alpha : float
+        The smoothing factor of the RMA.
+    out : np.ndarray
+        Preallocated output array with `len(tail) + 1` elements.
+    """
+    rma_value = seed
+    out[0] = seed
+    for index in range(tail.shape[0]):
+        rma_value = alpha * tail[index] + (1.0 - alpha) * rma_value
+        out[index + 1] = rma_value
+
+@njit(cache=True)
+def _first_valid_index(values: np.ndarray) -> int:
+    """
+    Return the index of the first non-NaN value of `values`, or
+    `len(values)` when every value is NaN.
+    """
+    index = 0
+    while index < values.shape[0] and np.isnan(values[index]):
+        index += 1
+    return index
+
+@njit(cache=True, parallel=True)
+def _rma_panel_kernel(source: np.ndarray, length: int, out: np.ndarray) -> None:
+    """
+    Fill each row of `out` with the RMA of the matching row of `source`,
+    processing the rows in parallel. Leading NaNs of a row are skipped
+    before seeding, and the matching outputs are set to NaN.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The source values, one row per symbol.
+    length : int
+        The number of periods to include in the RMA calculation.
+    out : np.ndarray
+        Preallocated output array with `source.shape[1] - length + 1`
+        columns.
+    """
+    alpha = 1.0 / length
+    for row in prange(source.shape[0]):
+        start = _first_valid_index(source[row])
+
+        if source.shape[1] - start < length:
+            out[row] = np.nan
+        else:
+            out[row, :start] = np.nan
+            _rma_kernel(
+                source[row, start + length:],
+                source[row, start:start + length].mean(),
+                alpha,
+                out[row, start:],
+            )
+
+@njit(
+    cache=True,
+    error_model="numpy",
+    fastmath=_FASTMATH,
+)
+def _rsi_kernel(source: np.ndarray, length: int, out: np.ndarray) -> None:
+    """
+    Fill `out` with the RSI of `source`, running the upward and downward
+    RMA recurrences in a single pass.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The source values.
+    length : int
+        The number of periods to include in the RSI calculation.
+    out : np.ndarray
+        Preallocated output array with `len(source) - length` elements.
+    """
+    alpha = 1.0 / length
+    seed_diff = np.diff(source[:length + 1])
+    seed_upward_diff = 0.5 * (seed_diff + np.abs(seed_diff))
+    upward_rma = seed_upward_diff.sum() / length
+    downward_rma = (seed_upward_diff - seed_diff).sum() / length
+    out[0] = 100.0 - 100.0 / (1.0 + upward_rma / downward_rma)
+
+    for index in range(length, source.shape[0] - 1):
+        source_diff = source[index + 1] - source[index]
+        upward_diff = 0.5 * (source_diff + abs(source_diff))
+        downward_diff = upward_diff - source_diff
+        upward_rma = alpha * upward_diff + (1.0 - alpha) * upward_rma
+        downward_rma = alpha * downward_diff + (1.0 - alpha) * downward_rma
+        out[index - length + 1] = (
+            100.0 - 100.0 / (1.0 + upward_rma / downward_rma)
+        )
+
+@njit(cache=True, parallel=True)
+def _rsi_panel_kernel(source: np.ndarray, length: int, out: np.ndarray) -> None:
+    """
+    Fill each row of `out` with the RSI of the matching row of `source`,
+    processing the rows in parallel. Leading NaNs of a row are skipped
+    before seeding, and the matching outputs are set to NaN.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The source values, one row per symbol.
+    length : int
+        The number of periods to include in the RSI calculation.
+    out : np.ndarray
+        Preallocated output array with `source.shape[1] - length`
+        columns.
+    """
+    for row in prange(source.shape[0]):
+        start = _first_valid_index(source[row])
+
+        if source.shape[1] - start <= length:
+            out[row] = np.nan
+        else:
+            out[row, :start] = np.nan
+            _rsi_kernel(source[row, start:], length, out[row, start:])
+
+@jitclass
+class RsiState:
+    """
+    The state of an RSI calculation, updated one price at a time.
+
+    Use `rsi_state` to build it from the price history, then call
+    `update` with every new price to get the next RSI value in O(1).
+
+    With numba installed this is a jitclass: it is compiled in every
+    process (jitclasses are not cached on disk), and each `update`
+    called from python pays a boxing overhead that makes it slower
+    than a plain python method. Pass batches of prices to
+    `update_many` to run the loop in compiled code instead.
+    """
+
+    previous_source: float
+    upward_rma: float
+    downward_rma: float
+    alpha: float
+
+    def __init__(
+        self,
+        previous_source: float,
+        upward_rma: float,
+        downward_rma: float,
+        alpha: float,
+    ):
+        self.previous_source = previous_source
+        self.upward_rma = upward_rma
+        self.downward_rma = downward_rma
+        self.alpha = alpha
+
+    def update(self, source: float) -> float:
+        """
+        Advance the state with a new price and return the RSI value.
+        """
+        source_diff = source - self.previous_source
+        upward_diff = 0.5 * (source_diff + abs(source_diff))
+        downward_diff = upward_diff - source_diff
+        self.upward_rma = (
+            self.alpha * upward_diff + (1.0 - self.alpha) * self.upward_rma
+        )
+        self.downward_rma = (
+            self.alpha * downward_diff
+            + (1.0 - self.alpha) * self.downward_rma
+        )
+        self.previous_source = source
+
+        if self.downward_rma == 0.0:
+            return 100.0 if self.upward_rma > 0.0 else np.nan
+
+        return 100.0 - 100.0 / (1.0 + self.upward_rma / self.downward_rma)
+
+    def update_many(self, source: np.ndarray) -> np.ndarray:
+        """
+        Advance the state with each price of `source` in order and
+        return the RSI values.
+        """
+        rsi_values = np.empty(source.shape[0])
+        for index in range(source.shape[0]):
+            rsi_values[index] = self.update(source[index])
+        return rsi_values
+
 def _rma_pandas(source: pd.Series, length: int, **kwargs) -> pd.Series:
     """
     Calculate the Relative Moving Average (RMA) of the input time series
@@ -26,19 +253,78 @@ def _rma_pandas(source: pd.Series, length: int, **kwargs) -> pd.Series:
     Note:
     -----
     The first values are different from the TradingView RMA.
+
+    When scipy is installed and no `kwargs` are given, the EWM is
+    evaluated with `scipy.signal.lfilter` instead of `.ewm().mean()`.
+    """
+    if length < 1:
+        raise ValueError("length must be at least 1")
+
+    if len(source) < length:
+        return pd.Series(np.nan, index=source.index, name="RMA")
+
+    alpha = 1 / length
+    source_values = source.to_numpy(np.float64, copy=False)
+
+    rma_values = np.empty(len(source_values))
+    rma_values[:length - 1] = np.nan
+    rma_values[length - 1] = source_values[:length].mean()
+    rma_values[length:] = source_values[length:]
+    ewm_source = rma_values[length - 1:]
+
+    if lfilter is not None and not kwargs and not np.isnan(ewm_source).any():
+        weighted_sum = lfilter([1.0], [1.0, alpha - 1.0], ewm_source)
+        weights_sum = lfilter(
+            [1.0], [1.0, alpha - 1.0], np.ones_like(ewm_source)
+        )
+        np.divide(weighted_sum, weights_sum, out=ewm_source)
+    else:
+        ewm_source[:] = (
+            pd.Series(ewm_source)
+            .ewm(alpha=alpha, **kwargs)
+            .mean()
+            .to_numpy()
+        )
+
+    return pd.Series(rma_values, name="RMA", index=source.index)
+
+def _rma_ndarray(source_values: np.ndarray, length: int) -> np.ndarray:
     """
-    sma = source.rolling(window=length, min_periods=length).mean()[:length]
-    rest = source[length:]
-    return (
-        pd.concat([sma, rest])
-        .ewm(alpha=1 / length, **kwargs)
-        .mean()
-    ).rename("RMA")
+    Calculate the Relative Moving Average (RMA) of the input array.
+
+    Parameters:
+    -----------
+    source_values : np.ndarray
+        The float64 values to calculate the RMA for.
+    length : int
+        The number of periods to include in the RMA calculation.
+
+    Returns:
+    --------
+    np.ndarray
+        The calculated RMA values, starting at the SMA of the first
+        `length` values (`len(source_values) - length + 1` elements).
+    """
+    if length < 1:
+        raise ValueError("length must be at least 1")
+
+    if len(source_values) < length:
+        raise ValueError("source must have at least `length` values")
+
+    rma_values = np.empty(len(source_values) - length + 1)
+    _rma_kernel(
+        source_values[length:],
+        source_values[:length].mean(),
+        1 / length,
+        rma_values,
+    )
+    return rma_values
 
 def _rma_python(source: pd.Series, length: int) -> pd.Series:
     """
     Calculate the Relative Moving Average (RMA) of the input time series
-    data using pure python.
+    data by running the RMA recurrence directly (in a numba kernel when
+    numba is installed).
 
     Parameters:
     -----------
@@ -54,34 +340,54 @@ def _rma_python(source: pd.Series, length: int) -> pd.Series:
 
     Note:
     -----
-    The pure python version is the only one with precision in the
+    This recurrence version is the only one with precision in the
     initial RMA values. However, with the simple RMA version,
-    both pandas and python versions will yield the same precision
+    both pandas and recurrence versions will yield the same precision
     in initial values.
     """
-    alpha = 1 / length
-    source_pd = _rma_pandas(source, length)[:length]
-    source_values = source[length:].to_numpy().tolist()
-
-    rma_value = float(source_pd.dropna().iloc[0])
-    rma_list = [rma_value]
-
-    for source_value in source_values:
-        rma_value = alpha * source_value + (1 - alpha) * rma_value
-        rma_list.append(rma_value)
-
     rma_series = pd.Series(
-        rma_list,
+        _rma_ndarray(source.to_numpy(np.float64, copy=False), length),
         name="RMA",
         index=source[length - 1:].index
     )
 
     return rma_series
 
+_RMA_METHODS = {"numpy": _rma_python, "pandas": _rma_pandas}
+
+_CACHE_SIZE = 128
+_cache: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+
+def _cached(key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+    """
+    Return the values stored under `key`, calling `compute` and storing
+    its result on a miss. The least recently used entry is evicted once
+    more than `_CACHE_SIZE` entries are stored.
+    """
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+
+    values = compute()
+    _cache[key] = values
+
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+
+    return values
+
+def clear_cache() -> None:
+    """
+    Remove every result memoized through the `cache_key` argument of
+    `rma` and `rsi`.
+    """
+    _cache.clear()
+
 def rma(
     source: pd.Series,
     length: int,
-    method: Literal["numpy", "pandas"] = "numpy"
+    method: Literal["numpy", "pandas"] = "numpy",
+    cache_key: Hashable | None = None,
 ) -> np.ndarray | pd.Series:
     """
     Calculate the Relative Moving Average (RMA) of the input time series
@@ -95,21 +401,105 @@ def rma(
         The number of periods to include in the RMA calculation.
     method : {"numpy", "pandas"}, optional
         The method to use for calculating the RMA, by default "numpy".
+    cache_key : Hashable, optional
+        A key identifying `source`. When given, the result is memoized
+        by `(cache_key, length, method)` and reused by later calls with
+        the same key, so the key must change whenever the data does.
 
     Returns:
     --------
     np.ndarray or pandas.Series
         The calculated RMA time series data.
     """
-    match method:
-        case "numpy":
-            return _rma_python(source, length)
-        case "pandas":
-            return _rma_pandas(source, length)
-        case _:
-            raise TypeError("method must be 'numpy' or 'pandas'")
+    try:
+        rma_method = _RMA_METHODS[method]
+    except KeyError:
+        raise TypeError("method must be 'numpy' or 'pandas'") from None
+
+    if cache_key is None:
+        return rma_method(source, length)
+
+    rma_values = _cached(
+        ("rma", cache_key, length, method),
+        lambda: rma_method(source, length).to_numpy(),
+    )
+    return pd.Series(
+        rma_values,
+        name="RMA",
+        index=source.index[len(source) - len(rma_values):],
+        copy=True,
+    )
+
+def rma_panel(source: pd.DataFrame, length: int) -> pd.DataFrame:
+    """
+    Calculate the Relative Moving Average (RMA) of every column of a
+    DataFrame in a single pass.
+
+    Parameters:
+    -----------
+    source : pd.DataFrame
+        The time series data, one column per symbol (e.g.
+        `prices.unstack("symbol")` for long-format data). Leading NaNs,
+        such as those of a symbol listed later than the others, are
+        skipped and the RMA of that column starts at the SMA of its
+        first `length` values; later NaNs propagate as in `rma`.
+    length : int
+        The number of periods to include in the RMA calculation.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The calculated RMA values, with the same columns as `source`.
+    """
+    if length < 1:
+        raise ValueError("length must be at least 1")
+
+    if len(source) < length:
+        raise ValueError("source must have at least `length` rows")
+
+    source_values = np.ascontiguousarray(source.to_numpy(np.float64).T)
+    rma_values = np.empty(
+        (source_values.shape[0], source_values.shape[1] - length + 1)
+    )
+    _rma_panel_kernel(source_values, length, rma_values)
+
+    return pd.DataFrame(
+        rma_values.T,
+        index=source.index[length - 1:],
+        columns=source.columns,
+    )
+
+def _rsi_values(source_values: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the RSI values of `source_values`, without the first
+    `length` values. Leading NaNs are skipped before seeding, and the
+    matching outputs are set to NaN.
+    """
+    if length < 1:
+        raise ValueError("length must be at least 1")
+
+    if len(source_values) <= length:
+        raise ValueError("source must have more than `length` values")
+
+    rsi_values = np.empty(len(source_values) - length)
+    start = _first_valid_index(source_values)
+
+    if len(source_values) - start <= length:
+        rsi_values[:] = np.nan
+        return rsi_values
+
+    rsi_values[:start] = np.nan
 
-def rsi(source: pd.Series, length: int) -> pd.Series:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _rsi_kernel(source_values[start:], length, rsi_values[start:])
+
+    return rsi_values
+
+def rsi(
+    source: pd.Series,
+    length: int,
+    cache_key: Hashable | None = None,
+) -> pd.Series:
     """
     Calculate the Relative Strength Index (RSI) for a given time series
     data.
@@ -120,22 +510,119 @@ def rsi(source: pd.Series, length: int) -> pd.Series:
         The input time series data for which to calculate RSI.
     length : int, optional
         The number of length to use for RSI calculation, by default 14.
+    cache_key : Hashable, optional
+        A key identifying `source`. When given, the result is memoized
+        by `(cache_key, length)` and reused by later calls with the same
+        key, so the key must change whenever the data does.
 
     Returns:
     --------
     pd.Series
-        The calculated RSI values for the input data.
+        The calculated RSI values for the input data, indexed by
+        `source.index[length:]`.
+
+    Note:
+    -----
+    Leading NaNs are skipped: the RSI starts `length` values after the
+    first price. A NaN after the first price is not dropped and makes
+    every later RSI value NaN.
+    """
+    source_values = source.to_numpy(np.float64, copy=False)
+
+    if cache_key is None:
+        rsi_values = _rsi_values(source_values, length)
+    else:
+        rsi_values = _cached(
+            ("rsi", cache_key, length),
+            lambda: _rsi_values(source_values, length),
+        )
+
+    return pd.Series(
+        rsi_values,
+        name="RSI",
+        index=source.index[length:],
+        copy=cache_key is not None,
+    )
+
+def rsi_panel(source: pd.DataFrame, length: int) -> pd.DataFrame:
+    """
+    Calculate the Relative Strength Index (RSI) of every column of a
+    DataFrame in a single pass.
+
+    Parameters:
+    -----------
+    source : pd.DataFrame
+        The input time series data, one column per symbol (e.g.
+        `prices.unstack("symbol")` for long-format data). Leading NaNs,
+        such as those of a symbol listed later than the others, are
+        skipped and the RSI of that column starts `length` values after
+        its first price; later NaNs propagate as in `rsi`.
+    length : int
+        The number of length to use for RSI calculation.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The calculated RSI values, with the same columns as `source`.
     """
-    upward_diff = pd.Series(
-        np.maximum(source - source.shift(1), 0.0)
-    ).dropna()
+    if length < 1:
+        raise ValueError("length must be at least 1")
+
+    if len(source) <= length:
+        raise ValueError("source must have more than `length` rows")
 
-    downward_diff = pd.Series(
-        np.maximum(source.shift(1) - source, 0.0)
-    ).dropna()
+    source_values = np.ascontiguousarray(source.to_numpy(np.float64).T)
+    rsi_values = np.empty(
+        (source_values.shape[0], source_values.shape[1] - length)
+    )
 
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _rsi_panel_kernel(source_values, length, rsi_values)
+
+    return pd.DataFrame(
+        rsi_values.T,
+        index=source.index[length:],
+        columns=source.columns,
+    )
 
-    relative_strength = rma(upward_diff, length) / rma(downward_diff, length)
+def rsi_state(source: pd.Series, length: int) -> RsiState:
+    """
+    Build an `RsiState` from the price history, so that new prices can
+    be added one at a time without recalculating the whole RSI.
 
-    rsi_series = 100 - (100 / (1 + relative_strength))
-    return rsi_series.rename("RSI")
+    Parameters:
+    -----------
+    source : pd.Series
+        The price history, with more than `length` values after its
+        leading NaNs, which are skipped as in `rsi`.
+    length : int
+        The number of length to use for RSI calculation.
+
+    Returns:
+    --------
+    RsiState
+        The state after the last value of `source`. Its `update` method
+        returns the same values `rsi` would return for the extended
+        series.
+    """
+    if length < 1:
+        raise ValueError("length must be at least 1")
+
+    source_values = source.to_numpy(np.float64, copy=False)
+    source_values = source_values[_first_valid_index(source_values):]
+
+    if len(source_values) <= length:
+        raise ValueError(
+            "source must have more than `length` values after leading NaNs"
+        )
+
+    source_diff = np.diff(source_values)
+    upward_diff = 0.5 * (source_diff + np.abs(source_diff))
+    downward_diff = upward_diff - source_diff
+
+    return RsiState(
+        source_values[-1],
+        _rma_ndarray(upward_diff, length)[-1],
+        _rma_ndarray(downward_diff, length)[-1],
+        1 / length,
+    )